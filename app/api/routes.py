@@ -3,12 +3,21 @@ API 路由定义
 """
 
 import uuid
+import orjson
 from fastapi import APIRouter, UploadFile, File, HTTPException
+from app.api.responses import ORJSONResponse
 from app.models.schemas import UploadResponse, DashboardResponse
 from app.services.talent_service import talent_service
+from app.services.mock_data import mock_expert_cache_info
 
 router = APIRouter(prefix="/api", tags=["dashboard"])
 
+# 上传文件分块读取大小（64KB）
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+# 允许上传的文件后缀（不区分大小写）
+ALLOWED_UPLOAD_SUFFIXES = ('.txt', '.text')
+
 
 @router.post("/upload", response_model=UploadResponse)
 async def upload_talent_ids(file: UploadFile = File(...)):
@@ -20,31 +29,30 @@ async def upload_talent_ids(file: UploadFile = File(...)):
     - 返回会话 ID 用于后续查询
     """
     # 验证文件类型
-    if not file.filename.endswith('.txt'):
+    if not file.filename.lower().endswith(ALLOWED_UPLOAD_SUFFIXES):
         raise HTTPException(
             status_code=400,
             detail="只支持 .txt 文件格式"
         )
     
-    try:
-        content = await file.read()
-        file_content = content.decode('utf-8')
-    except UnicodeDecodeError:
-        # 尝试 GBK 编码
-        try:
-            file_content = content.decode('gbk')
-        except:
-            raise HTTPException(
-                status_code=400,
-                detail="文件编码不支持，请使用 UTF-8 或 GBK 编码"
-            )
+    # 分块读取上传内容，解码交给解析阶段逐行进行
+    # （拼接为 bytes，解析时逐行读取可直接共享这块缓冲区）
+    chunks = []
+    while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+        chunks.append(chunk)
+    content = b''.join(chunks)
     
     # 生成会话 ID
     session_id = str(uuid.uuid4())[:8]
     
     # 处理上传
     try:
-        experts, stats = talent_service.process_upload(file_content, session_id)
+        talent_count = await talent_service.process_upload(content, session_id)
+    except UnicodeDecodeError:
+        raise HTTPException(
+            status_code=400,
+            detail="文件编码不支持，请使用 UTF-8 或 GBK 编码"
+        )
     except Exception as e:
         raise HTTPException(
             status_code=500,
@@ -53,8 +61,8 @@ async def upload_talent_ids(file: UploadFile = File(...)):
     
     return UploadResponse(
         success=True,
-        message=f"成功解析 {len(experts)} 位专家数据",
-        talent_count=len(experts),
+        message=f"成功解析 {talent_count} 位专家数据",
+        talent_count=talent_count,
         session_id=session_id
     )
 
@@ -65,23 +73,21 @@ async def get_dashboard(session_id: str):
     获取 Dashboard 数据
     
     - 根据 session_id 获取之前上传的专家数据
-    - 返回统计数据
+    - 返回上传时已计算并序列化好的统计数据
     """
-    experts = talent_service.get_cached_experts(session_id)
+    stats_json = await talent_service.get_cached_stats_json(session_id)
     
-    if not experts:
+    if stats_json is None:
         raise HTTPException(
             status_code=404,
             detail="会话不存在或已过期，请重新上传文件"
         )
     
-    stats = talent_service.calculate_stats(experts)
-    
-    return DashboardResponse(
-        success=True,
-        message="获取成功",
-        stats=stats
-    )
+    return ORJSONResponse({
+        "success": True,
+        "message": "获取成功",
+        "stats": orjson.Fragment(stats_json)
+    })
 
 
 @router.get("/dashboard/{session_id}/experts")
@@ -89,24 +95,26 @@ async def get_experts_detail(session_id: str, limit: int = 50, offset: int = 0):
     """
     获取专家详情列表（分页）
     """
-    experts = talent_service.get_cached_experts(session_id)
+    total, experts = await talent_service.get_cached_expert_page(session_id, offset, limit)
     
-    if not experts:
+    if not total:
         raise HTTPException(
             status_code=404,
             detail="会话不存在或已过期"
         )
     
-    paginated = experts[offset:offset + limit]
-    
     return {
         "success": True,
-        "total": len(experts),
-        "data": [e.model_dump() for e in paginated]
+        "total": total,
+        "data": experts
     }
 
 
 @router.get("/health")
 async def health_check():
-    """健康检查"""
-    return {"status": "ok", "service": "expert-dashboard"}
+    """健康检查（附带 Mock 专家缓存命中情况）"""
+    return {
+        "status": "ok",
+        "service": "expert-dashboard",
+        "mock_expert_cache": mock_expert_cache_info()
+    }
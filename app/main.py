@@ -7,6 +7,7 @@
     uvicorn app.main:app --reload --port 8080
 """
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.staticfiles import StaticFiles
 from fastapi.responses import FileResponse
@@ -14,21 +15,35 @@ from fastapi.middleware.cors import CORSMiddleware
 import os
 
 from app.api.routes import router as api_router
+from app.api.responses import ORJSONResponse
+from app.services.talent_service import talent_service
 
 # 获取项目根目录
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """应用生命周期：退出时关闭 Mock 数据进程池，释放真实 API 客户端和 Redis 的连接"""
+    yield
+    await talent_service.aclose()
+
 app = FastAPI(
     title="Dashboard",
     description="上传 talent_ids.txt，自动生成专家画像分析面板",
-    version="1.0.0"
+    version="1.0.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan
 )
 
-# CORS 配置（开发环境允许所有来源）
+# CORS 配置：CORS_ORIGINS 环境变量指定允许的来源（逗号分隔），按集合精确匹配；
+# 未配置时（开发环境）允许所有来源，但不携带凭据（通配符 + 凭据不符合 CORS 规范）
+CORS_ORIGINS = [o.strip() for o in os.environ.get("CORS_ORIGINS", "").split(",") if o.strip()]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
+    allow_origins=CORS_ORIGINS or ["*"],
+    allow_credentials=bool(CORS_ORIGINS),
     allow_methods=["*"],
     allow_headers=["*"],
 )
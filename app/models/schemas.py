@@ -5,10 +5,11 @@
 1. 清晰的接口结构，方便后续对接真实 API
 2. 使用 Pydantic 进行数据验证
 3. 支持扩展字段
+4. 模型创建后只读（frozen），可安全地在缓存和多个会话间共享同一实例
 """
 
 from typing import Dict, List, Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 from enum import Enum
 
 
@@ -30,6 +31,11 @@ class SchoolTier(str, Enum):
     OTHER = "其他"
 
 
+# KPI 口径：硕士及以上学历、名校（985 / 211 / 海外名校）
+MASTERS_AND_ABOVE = frozenset({DegreeLevel.MASTER, DegreeLevel.PHD})
+ELITE_SCHOOL_TIERS = frozenset({SchoolTier.TIER_985, SchoolTier.TIER_211, SchoolTier.OVERSEAS})
+
+
 class TechStack(str, Enum):
     """技术栈分类"""
     JAVA = "Java"
@@ -58,6 +64,9 @@ class TaskType(str, Enum):
 
 class Expert(BaseModel):
     """专家基础信息"""
+    # 专家数据可能来自外部 API，忽略未定义的字段而不是拒绝整条数据
+    model_config = ConfigDict(frozen=True, extra="ignore")
+    
     talent_id: str = Field(..., description="专家唯一标识")
     name: Optional[str] = Field(None, description="专家姓名（可选）")
     
@@ -99,6 +108,8 @@ class Expert(BaseModel):
 
 class TemplateRiskStats(BaseModel):
     """模板化风险统计"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     high_risk_count: int = Field(0, description="高风险专家数")
     high_risk_pct: float = Field(0, description="高风险占比")
     medium_risk_count: int = Field(0, description="中风险专家数")
@@ -111,6 +122,8 @@ class TemplateRiskStats(BaseModel):
 
 class QualityLabelStats(BaseModel):
     """质量标签统计"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     high_quality_count: int = Field(0, description="高质量专家数")
     high_quality_pct: float = Field(0, description="高质量占比")
     normal_count: int = Field(0, description="正常专家数")
@@ -121,6 +134,7 @@ class QualityLabelStats(BaseModel):
 
 class DashboardStats(BaseModel):
     """Dashboard 统计数据"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
     
     # 概览
     total_experts: int = Field(..., description="专家总数")
@@ -158,6 +172,8 @@ class DashboardStats(BaseModel):
 
 class UploadResponse(BaseModel):
     """上传响应"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     success: bool
     message: str
     talent_count: int = 0
@@ -166,6 +182,8 @@ class UploadResponse(BaseModel):
 
 class DashboardResponse(BaseModel):
     """Dashboard 响应"""
+    model_config = ConfigDict(frozen=True, extra="forbid")
+    
     success: bool
     message: str
     stats: Optional[DashboardStats] = None
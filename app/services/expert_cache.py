@@ -0,0 +1,254 @@
+"""
+会话数据缓存
+
+按上传内容的哈希（内容键）缓存计算好的统计数据和专家明细，会话 ID 绑定到内容键，
+相同文件的重复上传直接复用已有结果。内容自写入起按 TTL 过期，绑定新会话不会续期
+（会话随所绑定的内容一起过期），避免重复上传使数据一直不更新：
+1. 配置 REDIS_URL 时使用 Redis（多 worker / 多实例共享，按 TTL 过期）
+2. 否则使用进程内 TTL + LRU 缓存，专家明细落盘到临时文件
+"""
+
+import os
+from abc import ABC, abstractmethod
+import tempfile
+import weakref
+from array import array
+from typing import List, Dict, Tuple, Optional
+
+import orjson
+from cachetools import TTLCache
+from app.models.schemas import Expert, DashboardStats
+
+# 会话缓存上限（超出后淘汰最久未访问的会话）与过期时间（秒）
+SESSION_CACHE_MAXSIZE = 1024
+SESSION_CACHE_TTL = 3600
+
+# 写入 Redis 时每条 RPUSH 命令携带的专家数
+REDIS_PUSH_BATCH = 1000
+
+
+def _dump_expert(expert: Expert) -> bytes:
+    """序列化单个专家为 JSON（与接口返回格式一致，其他语言的服务也可直接读取）"""
+    return expert.model_dump_json().encode('utf-8')
+
+
+def _load_expert(record) -> Dict:
+    """反序列化单个专家，得到可直接返回给前端的字典"""
+    return orjson.loads(record)
+
+
+def _page_bounds(total: int, offset: int, limit: Optional[int]) -> Tuple[int, int]:
+    """计算 [offset, offset + limit) 与 [0, total) 的交集，limit 为 None 表示读到末尾"""
+    start = max(0, offset)
+    stop = total if limit is None else min(total, start + max(0, limit))
+    return start, max(start, stop)
+
+
+class ExpertCache(ABC):
+    """会话数据缓存接口（异步，Redis 读写不阻塞事件循环）"""
+    
+    @abstractmethod
+    async def set(self, content_key: str, experts: List[Expert], stats: DashboardStats) -> None:
+        """按内容键缓存专家列表和统计数据"""
+        pass
+    
+    @abstractmethod
+    async def bind(self, session_id: str, content_key: str) -> bool:
+        """将会话绑定到内容键（会话与内容同时过期），内容键未缓存（或已过期）时返回 False"""
+        pass
+    
+    @abstractmethod
+    async def get_stats_json(self, session_id: str) -> Optional[bytes]:
+        """获取统计数据（已序列化的 JSON），会话不存在或无专家时返回 None"""
+        pass
+    
+    @abstractmethod
+    async def get_page(
+        self, session_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[int, List[Dict]]:
+        """
+        分页获取专家序列化数据
+        
+        Returns:
+            (专家总数, 当前页专家数据)，会话不存在时为 (0, [])
+        """
+        pass
+    
+    async def aclose(self) -> None:
+        """释放缓存占用的连接"""
+        pass
+
+
+class _SessionData:
+    """
+    单个会话的缓存数据
+    
+    统计结果计算一次后以 JSON 字节常驻内存；专家明细逐条序列化为 JSON 写入临时文件，
+    按偏移表只读取分页所需的字节区间，不在内存中保留整批 Expert 对象
+    """
+    
+    def __init__(self, experts: List[Expert], stats: DashboardStats, expires_at: float):
+        self.total = len(experts)
+        # 过期时刻（与缓存计时器同一时钟），绑定到该数据的会话同时过期
+        self.expires_at = expires_at
+        self.stats_json = stats.model_dump_json().encode('utf-8')
+        
+        # offsets[i]:offsets[i + 1] 为第 i 位专家的字节区间
+        self._offsets = array('Q', [0])
+        fd, self._path = tempfile.mkstemp(prefix="experts_", suffix=".json")
+        with os.fdopen(fd, 'wb') as f:
+            for e in experts:
+                size = f.write(_dump_expert(e))
+                self._offsets.append(self._offsets[-1] + size)
+        
+        # 会话被缓存淘汰（对象回收）或进程退出时删除临时文件
+        weakref.finalize(self, os.remove, self._path)
+    
+    def read_experts(self, offset: int = 0, limit: Optional[int] = None) -> List[Dict]:
+        """读取 [offset, offset + limit) 区间的专家序列化数据"""
+        start, stop = _page_bounds(self.total, offset, limit)
+        if start == stop:
+            return []
+        
+        base = self._offsets[start]
+        with open(self._path, 'rb') as f:
+            f.seek(base)
+            buf = memoryview(f.read(self._offsets[stop] - base))
+        
+        return [
+            _load_expert(buf[self._offsets[i] - base:self._offsets[i + 1] - base])
+            for i in range(start, stop)
+        ]
+
+
+class LocalExpertCache(ExpertCache):
+    """进程内缓存（单 worker 部署 / 未配置 Redis 时使用）"""
+    
+    def __init__(self, maxsize: int = SESSION_CACHE_MAXSIZE, ttl: int = SESSION_CACHE_TTL):
+        # 内容键 -> 数据；会话 ID -> 同一数据对象（临时文件在所有引用都被淘汰后才删除）
+        self._contents: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._sessions: TTLCache = TTLCache(maxsize=maxsize, ttl=ttl)
+    
+    def _get_session(self, session_id: str) -> Optional[_SessionData]:
+        """获取会话数据，所绑定的内容已过期时视为不存在"""
+        session = self._sessions.get(session_id)
+        if session is None or session.expires_at <= self._sessions.timer():
+            return None
+        return session
+    
+    async def set(self, content_key: str, experts: List[Expert], stats: DashboardStats) -> None:
+        expires_at = self._contents.timer() + self._contents.ttl
+        self._contents[content_key] = _SessionData(experts, stats, expires_at)
+    
+    async def bind(self, session_id: str, content_key: str) -> bool:
+        data = self._contents.get(content_key)
+        if data is None:
+            return False
+        self._sessions[session_id] = data
+        return True
+    
+    async def get_stats_json(self, session_id: str) -> Optional[bytes]:
+        session = self._get_session(session_id)
+        if not session or not session.total:
+            return None
+        return session.stats_json
+    
+    async def get_page(
+        self, session_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[int, List[Dict]]:
+        session = self._get_session(session_id)
+        if not session:
+            return 0, []
+        return session.total, session.read_experts(offset, limit)
+
+
+class RedisExpertCache(ExpertCache):
+    """
+    Redis 缓存（多 worker / 多实例共享）
+    
+    - stats:{content_key}   统计数据 JSON
+    - experts:{content_key} 专家列表（每个元素为一位专家的 JSON），按 LRANGE 分页
+    - session:{session_id}  会话绑定的内容键
+    """
+    
+    def __init__(self, client, ttl: int = SESSION_CACHE_TTL):
+        # client 为 redis.asyncio.Redis
+        self._redis = client
+        self._ttl = ttl
+    
+    async def _content_key(self, session_id: str) -> Optional[str]:
+        """查询会话绑定的内容键"""
+        key = await self._redis.get(f"session:{session_id}")
+        return key.decode() if key is not None else None
+    
+    async def set(self, content_key: str, experts: List[Expert], stats: DashboardStats) -> None:
+        experts_key, stats_key = f"experts:{content_key}", f"stats:{content_key}"
+        async with self._redis.pipeline() as pipe:
+            pipe.delete(experts_key, stats_key)
+            if experts:
+                records = [_dump_expert(e) for e in experts]
+                for i in range(0, len(records), REDIS_PUSH_BATCH):
+                    pipe.rpush(experts_key, *records[i:i + REDIS_PUSH_BATCH])
+                pipe.expire(experts_key, self._ttl)
+                pipe.set(stats_key, stats.model_dump_json(), ex=self._ttl)
+            await pipe.execute()
+    
+    async def bind(self, session_id: str, content_key: str) -> bool:
+        # 不为内容续期：会话按内容的剩余有效期过期
+        remaining_ms = await self._redis.pttl(f"stats:{content_key}")
+        if remaining_ms <= 0:
+            return False
+        await self._redis.set(f"session:{session_id}", content_key, px=remaining_ms)
+        return True
+    
+    async def get_stats_json(self, session_id: str) -> Optional[bytes]:
+        content_key = await self._content_key(session_id)
+        if content_key is None:
+            return None
+        return await self._redis.get(f"stats:{content_key}")
+    
+    async def get_page(
+        self, session_id: str, offset: int = 0, limit: Optional[int] = None
+    ) -> Tuple[int, List[Dict]]:
+        content_key = await self._content_key(session_id)
+        if content_key is None:
+            return 0, []
+        experts_key = f"experts:{content_key}"
+        total = await self._redis.llen(experts_key)
+        start, stop = _page_bounds(total, offset, limit)
+        if start == stop:
+            return total, []
+        records = await self._redis.lrange(experts_key, start, stop - 1)
+        return total, [_load_expert(r) for r in records]
+    
+    async def aclose(self) -> None:
+        await self._redis.aclose()
+
+
+def create_expert_cache() -> ExpertCache:
+    """
+    根据 REDIS_URL 环境变量创建缓存
+    
+    未配置时使用进程内缓存；已配置时必须使用 Redis（run.py 会据此启动多个 worker，
+    回退到各进程独立的进程内缓存会导致会话在 worker 之间丢失）
+    
+    Raises:
+        RuntimeError: 已配置 REDIS_URL 但未安装 redis 或 Redis 不可用
+    """
+    redis_url = os.environ.get("REDIS_URL")
+    if not redis_url:
+        return LocalExpertCache()
+    
+    try:
+        import redis.asyncio
+    except ImportError as e:
+        raise RuntimeError("已配置 REDIS_URL 但未安装 redis") from e
+    
+    # 启动时用同步客户端检查一次连通性，运行期读写使用异步客户端
+    try:
+        with redis.Redis.from_url(redis_url) as client:
+            client.ping()
+    except redis.RedisError as e:
+        raise RuntimeError(f"已配置 REDIS_URL 但 Redis 不可用：{e}") from e
+    
+    return RedisExpertCache(redis.asyncio.Redis.from_url(redis_url))
@@ -5,52 +5,93 @@ Mock 数据生成器
 后续可替换为真实 API 调用。
 """
 
+import asyncio
+import os
+import re
 import random
-import hashlib
-from typing import List, Dict
+import zlib
+from typing import List, Dict, Optional, Tuple
 from collections import Counter
+from concurrent.futures import Executor
+from itertools import accumulate, chain
+from cachetools import LRUCache
 from app.models.schemas import Expert, DegreeLevel, SchoolTier
 
 
-# 模拟数据池
-MOCK_NAMES = [
+# 批量生成时启用多进程的最小专家数（按未命中缓存的数量计）
+# 单位专家生成约 25µs，按块整体传回时主进程反序列化约 5µs，
+# 2000 位以下时进程池的调度开销抵消收益
+PARALLEL_THRESHOLD = 2000
+
+# 预计算的任务画像原型数量
+TASK_PROFILE_COUNT = 256
+
+# 模拟专家缓存条数（单个 Expert 约 4KB，2 万条约 80MB）
+MOCK_EXPERT_CACHE_SIZE = 20_000
+
+# 模拟数据池（只读常量统一使用元组）
+MOCK_NAMES = (
     "张伟", "王芳", "李明", "刘洋", "陈静", "杨帆", "赵强", "黄磊",
     "周杰", "吴敏", "郑华", "孙燕", "马超", "朱峰", "胡鹏", "林涛",
     "何雨", "罗军", "梁静", "宋健", "唐文", "韩雪", "曹亮", "许晨"
-]
+)
 
 MOCK_SCHOOLS = {
-    SchoolTier.TIER_985: [
+    SchoolTier.TIER_985: (
         "清华大学", "北京大学", "复旦大学", "上海交通大学", "浙江大学",
         "南京大学", "中国科学技术大学", "哈尔滨工业大学", "西安交通大学", "武汉大学"
-    ],
-    SchoolTier.TIER_211: [
+    ),
+    SchoolTier.TIER_211: (
         "北京邮电大学", "华东理工大学", "南京航空航天大学", "西安电子科技大学",
         "武汉理工大学", "中南财经政法大学", "苏州大学", "上海大学"
-    ],
-    SchoolTier.OVERSEAS: [
+    ),
+    SchoolTier.OVERSEAS: (
         "MIT", "Stanford University", "Carnegie Mellon", "UC Berkeley",
         "Cambridge University", "Oxford University", "ETH Zurich"
-    ],
-    SchoolTier.NORMAL: [
+    ),
+    SchoolTier.NORMAL: (
         "北京工商大学", "上海应用技术大学", "杭州电子科技大学", "成都理工大学",
         "广东工业大学", "武汉科技大学", "长沙理工大学"
-    ],
-    SchoolTier.OTHER: ["其他院校"]
+    ),
+    SchoolTier.OTHER: ("其他院校",)
 }
 
-TECH_STACKS = ["Java", "C++", "Python", "前端", "后端", "全栈", "架构", "算法", "数据", "运维", "AI/ML"]
+# 学历分布权重
+DEGREE_WEIGHTS = (
+    (DegreeLevel.MASTER, 40),
+    (DegreeLevel.BACHELOR, 35),
+    (DegreeLevel.PHD, 10),
+    (DegreeLevel.COLLEGE, 10),
+    (DegreeLevel.OTHER, 5)
+)
+
+# 学校层级分布权重
+SCHOOL_TIER_WEIGHTS = (
+    (SchoolTier.TIER_985, 25),
+    (SchoolTier.TIER_211, 20),
+    (SchoolTier.OVERSEAS, 10),
+    (SchoolTier.NORMAL, 35),
+    (SchoolTier.OTHER, 10)
+)
 
-SKILLS = [
+# 预先拆分候选项与累计权重，每位专家抽样时不再重建列表和累加权重
+DEGREE_CHOICES = tuple(d for d, _ in DEGREE_WEIGHTS)
+DEGREE_CUM_WEIGHTS = tuple(accumulate(w for _, w in DEGREE_WEIGHTS))
+SCHOOL_TIER_CHOICES = tuple(t for t, _ in SCHOOL_TIER_WEIGHTS)
+SCHOOL_TIER_CUM_WEIGHTS = tuple(accumulate(w for _, w in SCHOOL_TIER_WEIGHTS))
+
+TECH_STACKS = ("Java", "C++", "Python", "前端", "后端", "全栈", "架构", "算法", "数据", "运维", "AI/ML")
+
+SKILLS = (
     "Python", "Java", "JavaScript", "TypeScript", "Go", "Rust", "C++",
     "React", "Vue", "Node.js", "Spring Boot", "Django", "FastAPI",
     "MySQL", "PostgreSQL", "MongoDB", "Redis", "Elasticsearch",
     "Docker", "Kubernetes", "AWS", "阿里云", "微服务", "分布式系统",
     "机器学习", "深度学习", "NLP", "计算机视觉", "推荐系统",
     "系统设计", "高并发", "性能优化", "安全", "测试"
-]
+)
 
-TASK_TYPES = ["面试辅导", "简历优化", "职业规划", "技能培训", "模拟面试", "其他"]
+TASK_TYPES = ("面试辅导", "简历优化", "职业规划", "技能培训", "模拟面试", "其他")
 
 # 任务类型关键词（用于模拟 prompt 分析）
 TASK_TYPE_KEYWORDS = {
@@ -64,37 +105,83 @@ TASK_TYPE_KEYWORDS = {
     "总结": ["总结", "概括", "摘要"],
 }
 
+TASK_TYPE_NAMES = tuple(TASK_TYPE_KEYWORDS.keys())
+
 # 领域标签
-DOMAIN_LABELS = [
+DOMAIN_LABELS = (
     "K12教育", "高等教育/科研", "临床医学", "投资/证券", "财务/会计",
     "软件开发", "产品/运营", "市场/营销", "法律/合规", "设计/创意",
     "项目/管理", "人力/行政", "咨询/分析", "文化/传媒", "通用/日常"
-]
+)
 
-BIG_COMPANIES = [
+BIG_COMPANIES = (
     "腾讯", "阿里巴巴", "字节跳动", "华为", "美团", "京东", "百度",
     "快手", "小米", "网易", "滴滴", "拼多多", "微软", "Google", "Amazon"
-]
+)
 
-NORMAL_COMPANIES = [
+NORMAL_COMPANIES = (
     "某科技公司", "某互联网公司", "某创业公司", "某金融科技公司",
     "某软件公司", "某游戏公司", "某电商公司"
-]
+)
 
 # Prompt 模板样本（用于模拟不同结构的任务）
-PROMPT_TEMPLATES = [
+PROMPT_TEMPLATES = (
     "请帮我{action}一下{object}",
     "我需要{action}{object}，要求{requirement}",
     "1. {step1}\n2. {step2}\n3. {step3}",
     "{object}是什么？请详细解释",
     "帮我分析一下{object}的{aspect}",
     "请根据以下要求{action}：{requirement}",
-]
+)
+
 
+# 结构特征匹配（多个关键词合并为一个正则，单次扫描）
+QUESTION_RE = re.compile(r"[?？]")
+INSTRUCTION_RE = re.compile(r"请|帮我|需要|希望")
+LIST_RE = re.compile(r"1\.|2\.|①|②|-|•")
 
-def generate_task_queries(rng: random.Random, count: int, template_bias: float = 0.3) -> List[Dict]:
+
+def _render_query(template_id: int, domain_id: int, type_id: int) -> str:
+    """拼出模拟任务的 query 文本（实际不需要真实内容，只需要结构特征）"""
+    return f"[{DOMAIN_LABELS[domain_id]}] {PROMPT_TEMPLATES[template_id]} - {TASK_TYPE_NAMES[type_id]}任务"
+
+
+def _extract_pattern(query: str) -> tuple:
+    """提取单条 query 的结构特征"""
+    length_bucket = len(query) // 50
+    has_question = QUESTION_RE.search(query) is not None
+    has_instruction = INSTRUCTION_RE.search(query) is not None
+    has_list = LIST_RE.search(query) is not None
+    first_chars = query[:5] if len(query) >= 5 else query
+    
+    return (length_bucket, has_question, has_instruction, has_list, first_chars)
+
+
+def _build_task_pattern_ids() -> Dict[tuple, int]:
     """
-    生成模拟的任务 Query 列表
+    预计算 (template_id, domain_id, type_id) → 结构模式编号
+    
+    模拟 query 完全由这三个编号决定，启动时对全部组合提取一次结构特征，
+    生成任务时只需查表，不再逐条拼接和扫描字符串
+    """
+    pattern_index: Dict[tuple, int] = {}
+    table = {}
+    for template_id in range(len(PROMPT_TEMPLATES)):
+        for domain_id in range(len(DOMAIN_LABELS)):
+            for type_id in range(len(TASK_TYPE_NAMES)):
+                pattern = _extract_pattern(_render_query(template_id, domain_id, type_id))
+                table[template_id, domain_id, type_id] = pattern_index.setdefault(pattern, len(pattern_index))
+    return table
+
+
+TASK_PATTERN_IDS = _build_task_pattern_ids()
+
+
+def generate_task_queries(
+    rng: random.Random, count: int, template_bias: float = 0.3
+) -> Tuple[List[int], List[int], List[int]]:
+    """
+    生成模拟的任务列表
     
     Args:
         rng: 随机数生成器
@@ -102,58 +189,51 @@ def generate_task_queries(rng: random.Random, count: int, template_bias: float =
         template_bias: 模板化程度偏向（0-1），越高越倾向于使用相同模板
         
     Returns:
-        任务列表，包含 query, task_type, domain
+        (template_ids, domain_ids, type_ids)：按任务顺序排列的模板、领域、任务类型编号
     """
-    tasks = []
-    
     # 根据 template_bias 决定使用多少种模板
+    template_ids = range(len(PROMPT_TEMPLATES))
     if template_bias > 0.6:
         # 高模板化：主要使用 1-2 种模板
-        template_pool = rng.sample(PROMPT_TEMPLATES, k=min(2, len(PROMPT_TEMPLATES)))
+        template_pool = rng.sample(template_ids, k=min(2, len(template_ids)))
     elif template_bias > 0.3:
         # 中等：使用 3-4 种模板
-        template_pool = rng.sample(PROMPT_TEMPLATES, k=min(4, len(PROMPT_TEMPLATES)))
+        template_pool = rng.sample(template_ids, k=min(4, len(template_ids)))
     else:
         # 低模板化：使用全部模板
-        template_pool = PROMPT_TEMPLATES.copy()
+        template_pool = list(template_ids)
     
     # 领域分布：根据 template_bias 决定领域集中度
+    domain_ids = range(len(DOMAIN_LABELS))
     if template_bias > 0.5:
         # 集中于 1-2 个领域
-        domain_pool = rng.sample(DOMAIN_LABELS, k=min(2, len(DOMAIN_LABELS)))
+        domain_pool = rng.sample(domain_ids, k=min(2, len(domain_ids)))
     else:
         # 分布于多个领域
-        domain_pool = rng.sample(DOMAIN_LABELS, k=min(6, len(DOMAIN_LABELS)))
+        domain_pool = rng.sample(domain_ids, k=min(6, len(domain_ids)))
     
     # 任务类型分布
-    type_keys = list(TASK_TYPE_KEYWORDS.keys())
+    type_ids = range(len(TASK_TYPE_NAMES))
     if template_bias > 0.5:
-        type_pool = rng.sample(type_keys, k=min(2, len(type_keys)))
+        type_pool = rng.sample(type_ids, k=min(2, len(type_ids)))
     else:
-        type_pool = rng.sample(type_keys, k=min(5, len(type_keys)))
-    
-    for _ in range(count):
-        template = rng.choice(template_pool)
-        domain = rng.choice(domain_pool)
-        task_type = rng.choice(type_pool)
-        
-        # 简单的模板填充（实际不需要真实内容，只需要结构特征）
-        query = f"[{domain}] {template} - {task_type}任务"
-        
-        tasks.append({
-            "query": query,
-            "task_type": task_type,
-            "domain": domain,
-            "template_id": PROMPT_TEMPLATES.index(template) if template in PROMPT_TEMPLATES else -1
-        })
+        type_pool = rng.sample(type_ids, k=min(5, len(type_ids)))
     
-    return tasks
+    # 每个池子一次性批量抽样，而不是每个任务分别调用 3 次 rng.choice
+    return (
+        rng.choices(template_pool, k=count),
+        rng.choices(domain_pool, k=count),
+        rng.choices(type_pool, k=count),
+    )
 
 
-def analyze_prompt_structure(tasks: List[Dict]) -> Dict:
+def analyze_prompt_structure(pattern_ids: List[int]) -> Dict:
     """
     分析 Prompt 结构差异度（基于 analyze_expert_diversity.py 的逻辑）
     
+    Args:
+        pattern_ids: 每个任务的结构模式编号（相同结构特征对应相同编号）
+    
     Returns:
         dict: {
             "unique_patterns": int,
@@ -162,7 +242,7 @@ def analyze_prompt_structure(tasks: List[Dict]) -> Dict:
             "structure_score": int (0-100)
         }
     """
-    if not tasks:
+    if not pattern_ids:
         return {
             "unique_patterns": 0,
             "template_ratio": 0,
@@ -170,101 +250,81 @@ def analyze_prompt_structure(tasks: List[Dict]) -> Dict:
             "structure_score": 0
         }
     
-    # 提取结构特征
-    patterns = []
-    for t in tasks:
-        query = t.get("query", "")
-        if not query:
-            continue
-        
-        # 结构特征
-        length_bucket = len(query) // 50
-        has_question = "?" in query or "？" in query
-        has_instruction = any(kw in query for kw in ["请", "帮我", "需要", "希望"])
-        has_list = any(c in query for c in ["1.", "2.", "①", "②", "-", "•"])
-        first_chars = query[:5] if len(query) >= 5 else query
-        
-        pattern = (length_bucket, has_question, has_instruction, has_list, first_chars)
-        patterns.append(pattern)
-    
-    if not patterns:
-        return {
-            "unique_patterns": 0,
-            "template_ratio": 0,
-            "pattern_diversity": 0,
-            "structure_score": 0
-        }
-    
-    unique_patterns = len(set(patterns))
-    total = len(patterns)
+    pattern_counts = Counter(pattern_ids)
+    unique_patterns = len(pattern_counts)
+    total = len(pattern_ids)
     
     # 模板化程度
-    pattern_counts = Counter(patterns)
-    most_common_count = pattern_counts.most_common(1)[0][1] if pattern_counts else 0
-    template_ratio = most_common_count / total if total > 0 else 0
+    most_common_count = max(pattern_counts.values())
     
-    # 多样性得分
-    pattern_diversity = unique_patterns / total if total > 0 else 0
-    
-    # StructureScore (0-100)
-    base_score = pattern_diversity * 100
-    template_penalty = template_ratio * 30
-    structure_score = max(0, min(100, base_score - template_penalty))
+    # StructureScore (0-100) = 多样性 × 100 - 模板化程度 × 30，按整数运算
+    structure_score = _round_div(unique_patterns * 100 - most_common_count * 30, total)
     
     return {
         "unique_patterns": unique_patterns,
-        "template_ratio": round(template_ratio, 3),
-        "pattern_diversity": round(pattern_diversity, 3),
-        "structure_score": round(structure_score)
+        "template_ratio": round(most_common_count / total, 3),
+        "pattern_diversity": round(unique_patterns / total, 3),
+        "structure_score": max(0, min(100, structure_score))
     }
 
 
-def calculate_type_score(task_types: List[str]) -> int:
-    """计算任务类型多样性得分 (0-100)"""
-    if not task_types:
+def _round_div(numerator: int, denominator: int) -> int:
+    """整数除法并取整（分母为正），与 round() 一致采用银行家舍入，打分全程使用整数运算"""
+    quotient, remainder = divmod(numerator, denominator)
+    doubled = remainder * 2
+    if doubled > denominator or (doubled == denominator and quotient & 1):
+        quotient += 1
+    return quotient
+
+
+def calculate_type_score(type_ids: List[int]) -> int:
+    """计算任务类型多样性得分 (0-100)，type_ids 为 TASK_TYPE_NAMES 下标"""
+    if not type_ids:
         return 0
     
-    type_counter = Counter(task_types)
+    type_counter = Counter(type_ids)
     unique_types = len(type_counter)
-    total = len(task_types)
+    total = len(type_ids)
     
     # 基础分：类型数量（每种15分，满分60分）
     base_score = min(unique_types * 15, 60)
     
-    # 均衡性加分
-    top_ratio = type_counter.most_common(1)[0][1] / total if total > 0 else 1
-    balance_score = max(0, (1 - top_ratio) * 50)
+    # 均衡性加分：(1 - 最高占比) × 50；与基础分相加后整体取整
+    # （基础分可能为奇数，只对加分项取整会使恰好 .5 的情况舍入方向相反）
+    top_count = max(type_counter.values())
+    score = _round_div(base_score * total + (total - top_count) * 50, total)
     
-    return min(100, round(base_score + balance_score))
+    return min(100, score)
 
 
-def calculate_domain_score(domains: List[str]) -> int:
-    """计算领域多样性得分 (0-100)"""
-    if not domains:
+def calculate_domain_score(domain_ids: List[int]) -> int:
+    """计算领域多样性得分 (0-100)，domain_ids 为 DOMAIN_LABELS 下标"""
+    if not domain_ids:
         return 0
     
-    domain_counter = Counter(domains)
+    domain_counter = Counter(domain_ids)
     unique_domains = len(domain_counter)
-    total = len(domains)
+    total = len(domain_ids)
     
     # 基础分
     base_score = min(unique_domains * 12, 60)
     
-    # 集中度惩罚
-    top_ratio = domain_counter.most_common(1)[0][1] / total if total > 0 else 1
-    if top_ratio >= 0.9:
+    # 集中度惩罚（按最高占比的十分位判断）
+    top_count = max(domain_counter.values())
+    top_tenths = top_count * 10
+    if top_tenths >= total * 9:
         concentration_penalty = 40
-    elif top_ratio >= 0.8:
+    elif top_tenths >= total * 8:
         concentration_penalty = 30
-    elif top_ratio >= 0.7:
+    elif top_tenths >= total * 7:
         concentration_penalty = 20
     else:
         concentration_penalty = 0
     
-    balance_score = max(0, (1 - top_ratio) * 50)
+    balance_score = _round_div((total - top_count) * 50, total)
     final_score = base_score + balance_score - concentration_penalty
     
-    return max(0, min(100, round(final_score)))
+    return max(0, min(100, final_score))
 
 
 def determine_template_risk_level(template_ratio: float, pattern_diversity: float) -> Dict:
@@ -347,53 +407,15 @@ def determine_quality_label(
     }
 
 
-def generate_mock_expert(talent_id: str) -> Expert:
+def _build_task_profile(seed: int) -> Dict:
     """
-    根据 talent_id 生成一个模拟专家
+    根据种子生成一份任务画像
     
-    使用 talent_id 的 hash 作为随机种子，保证相同 ID 生成相同数据
+    包含任务数、任务类型/领域、各维度得分、模板风险与质量标签，
+    即专家数据中计算量最大（需要生成任务并分析结构）的部分
     """
-    # 用 talent_id 生成固定的随机种子
-    seed = int(hashlib.md5(talent_id.encode()).hexdigest()[:8], 16)
     rng = random.Random(seed)
     
-    # 学历分布
-    degree_weights = [
-        (DegreeLevel.MASTER, 40),
-        (DegreeLevel.BACHELOR, 35),
-        (DegreeLevel.PHD, 10),
-        (DegreeLevel.COLLEGE, 10),
-        (DegreeLevel.OTHER, 5)
-    ]
-    degree = rng.choices(
-        [d[0] for d in degree_weights],
-        weights=[d[1] for d in degree_weights]
-    )[0]
-    
-    # 学校层级分布
-    tier_weights = [
-        (SchoolTier.TIER_985, 25),
-        (SchoolTier.TIER_211, 20),
-        (SchoolTier.OVERSEAS, 10),
-        (SchoolTier.NORMAL, 35),
-        (SchoolTier.OTHER, 10)
-    ]
-    school_tier = rng.choices(
-        [t[0] for t in tier_weights],
-        weights=[t[1] for t in tier_weights]
-    )[0]
-    
-    school_name = rng.choice(MOCK_SCHOOLS[school_tier])
-    
-    # 技术栈
-    tech_stacks = rng.sample(TECH_STACKS, k=rng.randint(1, 3))
-    
-    # 技能
-    skills = rng.sample(SKILLS, k=rng.randint(3, 8))
-    
-    # 工作年限
-    years_of_exp = rng.randint(1, 15)
-    
     # 任务数
     task_count = int(rng.expovariate(0.08))
     task_count = max(3, min(task_count, 60))
@@ -402,21 +424,19 @@ def generate_mock_expert(talent_id: str) -> Expert:
     template_bias = rng.uniform(0.1, 0.8)
     
     # 生成任务列表
-    tasks = generate_task_queries(rng, task_count, template_bias)
+    template_ids, domain_ids, type_ids = generate_task_queries(rng, task_count, template_bias)
     
     # 分析 Prompt 结构
-    structure_analysis = analyze_prompt_structure(tasks)
+    pattern_ids = [TASK_PATTERN_IDS[key] for key in zip(template_ids, domain_ids, type_ids)]
+    structure_analysis = analyze_prompt_structure(pattern_ids)
     
     # 计算各维度分数
-    task_types = [t["task_type"] for t in tasks]
-    domains = [t["domain"] for t in tasks]
-    
-    type_score = calculate_type_score(task_types)
-    domain_score = calculate_domain_score(domains)
+    type_score = calculate_type_score(type_ids)
+    domain_score = calculate_domain_score(domain_ids)
     structure_score = structure_analysis["structure_score"]
     
     # 总分
-    diversity_score = round(type_score * 0.4 + domain_score * 0.4 + structure_score * 0.2)
+    diversity_score = _round_div(type_score * 40 + domain_score * 40 + structure_score * 20, 100)
     
     # 模板风险等级
     template_risk = determine_template_risk_level(
@@ -430,6 +450,70 @@ def generate_mock_expert(talent_id: str) -> Expert:
         diversity_score, task_count, template_risk["level"]
     )
     
+    return {
+        "task_count": task_count,
+        "task_types": [TASK_TYPE_NAMES[i] for i in set(type_ids)],
+        "domains": [DOMAIN_LABELS[i] for i in set(domain_ids)],
+        "type_score": type_score,
+        "domain_score": domain_score,
+        "structure_score": structure_score,
+        "diversity_score": diversity_score,
+        "template_ratio": structure_analysis["template_ratio"],
+        "unique_patterns": structure_analysis["unique_patterns"],
+        "template_risk_level": template_risk["level"],
+        "template_risk_description": template_risk["description"],
+        "quality_label": quality_info["label"],
+        "quality_label_reason": quality_info["reason"],
+    }
+
+
+# 任务画像原型：启动时完整计算一次，每位专家按种子选取其一，
+# 不再为每位专家重新生成任务和分析结构（Mock 数据无需每人独立的任务画像）
+TASK_PROFILES = tuple(_build_task_profile(i) for i in range(TASK_PROFILE_COUNT))
+
+
+# 模拟专家 LRU 缓存（只在主进程中读写，进程池只负责生成未命中的专家）
+_mock_expert_cache: LRUCache = LRUCache(maxsize=MOCK_EXPERT_CACHE_SIZE)
+_mock_expert_cache_stats = {"hits": 0, "misses": 0}
+
+
+def mock_expert_cache_info() -> Dict[str, int]:
+    """模拟专家缓存命中情况"""
+    return {
+        **_mock_expert_cache_stats,
+        "maxsize": int(_mock_expert_cache.maxsize),
+        "currsize": int(_mock_expert_cache.currsize),
+    }
+
+
+def _build_mock_expert(talent_id: str) -> Expert:
+    """
+    根据 talent_id 生成一个模拟专家（不经过缓存）
+    
+    使用 talent_id 的 hash 作为随机种子，保证相同 ID 生成相同数据；
+    任务相关字段取自预先计算的任务画像原型（TASK_PROFILES），其余背景信息按 ID 单独抽样。
+    """
+    # 用 talent_id 生成固定的随机种子（非加密用途，CRC32 即可，无需 MD5 + 十六进制解析）
+    seed = zlib.crc32(talent_id.encode('utf-8')) & 0xFFFFFFFF
+    rng = random.Random(seed)
+    
+    # 学历分布
+    degree = rng.choices(DEGREE_CHOICES, cum_weights=DEGREE_CUM_WEIGHTS)[0]
+    
+    # 学校层级分布
+    school_tier = rng.choices(SCHOOL_TIER_CHOICES, cum_weights=SCHOOL_TIER_CUM_WEIGHTS)[0]
+    
+    school_name = rng.choice(MOCK_SCHOOLS[school_tier])
+    
+    # 技术栈
+    tech_stacks = rng.sample(TECH_STACKS, k=rng.randint(1, 3))
+    
+    # 技能
+    skills = rng.sample(SKILLS, k=rng.randint(3, 8))
+    
+    # 工作年限
+    years_of_exp = rng.randint(1, 15)
+    
     # 大厂经历
     has_big_company = rng.random() < 0.30
     if has_big_company:
@@ -437,9 +521,6 @@ def generate_mock_expert(talent_id: str) -> Expert:
     else:
         companies = rng.sample(NORMAL_COMPANIES, k=rng.randint(1, 2))
     
-    # 任务类型列表
-    task_type_list = list(set(task_types))
-    
     return Expert(
         talent_id=talent_id,
         name=rng.choice(MOCK_NAMES),
@@ -449,25 +530,96 @@ def generate_mock_expert(talent_id: str) -> Expert:
         tech_stacks=tech_stacks,
         skills=skills,
         years_of_experience=years_of_exp,
-        task_count=task_count,
-        task_types=task_type_list,
-        # 新增字段
-        type_score=type_score,
-        domain_score=domain_score,
-        structure_score=structure_score,
-        diversity_score=diversity_score,
-        template_ratio=structure_analysis["template_ratio"],
-        unique_patterns=structure_analysis["unique_patterns"],
-        template_risk_level=template_risk["level"],
-        template_risk_description=template_risk["description"],
-        quality_label=quality_info["label"],
-        quality_label_reason=quality_info["reason"],
-        domains=list(set(domains)),
         has_big_company_exp=has_big_company,
-        companies=companies
+        companies=companies,
+        # 任务画像（任务数、类型/领域、多样性评分、模板风险、质量标签）
+        **TASK_PROFILES[seed % TASK_PROFILE_COUNT]
     )
 
 
+def _build_mock_expert_chunk(talent_ids: List[str]) -> List[Expert]:
+    """在 worker 进程中生成一块专家（不经过缓存），整块结果一次序列化传回"""
+    return [_build_mock_expert(tid) for tid in talent_ids]
+
+
+def _lookup_cached(talent_ids: List[str]) -> Tuple[List[Optional[Expert]], List[str]]:
+    """
+    在当前进程的 LRU 缓存中查找
+    
+    Returns:
+        (与 talent_ids 对齐的缓存结果（未命中为 None）, 去重后的未命中 ID)
+    """
+    cached = [_mock_expert_cache.get(tid) for tid in talent_ids]
+    misses = list(dict.fromkeys(tid for tid, e in zip(talent_ids, cached) if e is None))
+    return cached, misses
+
+
+def _merge_generated(
+    talent_ids: List[str], cached: List[Optional[Expert]], misses: List[str], built
+) -> List[Expert]:
+    """将新生成的专家写回缓存，并与缓存命中的结果按 talent_ids 顺序合并"""
+    # 未命中数可能超过缓存容量，本批结果单独保存，不依赖写回后的缓存
+    generated = dict(zip(misses, built))
+    _mock_expert_cache.update(generated)
+    _mock_expert_cache_stats["hits"] += len(talent_ids) - len(misses)
+    _mock_expert_cache_stats["misses"] += len(misses)
+    
+    return [e if e is not None else generated[tid] for tid, e in zip(talent_ids, cached)]
+
+
+def generate_mock_expert(talent_id: str) -> Expert:
+    """根据 talent_id 获取模拟专家，结果按 talent_id 做 LRU 缓存（返回的 Expert 为只读共享实例）"""
+    return generate_mock_experts([talent_id])[0]
+
+
 def generate_mock_experts(talent_ids: List[str]) -> List[Expert]:
-    """批量生成模拟专家数据"""
-    return [generate_mock_expert(tid) for tid in talent_ids]
+    """
+    批量生成模拟专家数据（在当前进程中生成）
+    
+    先在当前进程的 LRU 缓存中查找，只生成未命中的专家并写回缓存
+    
+    Args:
+        talent_ids: 专家 ID 列表
+    
+    Returns:
+        专家列表（顺序与 talent_ids 一致）
+    """
+    cached, misses = _lookup_cached(talent_ids)
+    return _merge_generated(talent_ids, cached, misses, map(_build_mock_expert, misses))
+
+
+async def generate_mock_experts_async(
+    talent_ids: List[str], executor: Optional[Executor] = None
+) -> List[Expert]:
+    """
+    批量生成模拟专家数据，未命中较多时在进程池中并行生成
+    
+    缓存始终由当前进程维护（worker 进程只负责生成未命中的专家）；
+    等待进程池期间不阻塞事件循环
+    
+    Args:
+        talent_ids: 专家 ID 列表
+        executor: 进程池（可选）。未命中数量达到 PARALLEL_THRESHOLD 时分块并行生成，
+            小批量时进程间通信开销大于收益，直接在当前进程生成
+    
+    Returns:
+        专家列表（顺序与 talent_ids 一致）
+    
+    Raises:
+        BrokenProcessPool: 进程池中有 worker 异常退出
+    """
+    cached, misses = _lookup_cached(talent_ids)
+    
+    if executor is None or len(misses) < PARALLEL_THRESHOLD:
+        built = map(_build_mock_expert, misses)
+    else:
+        # 每个 worker 约分到 4 块，摊薄 pickle/IPC 开销
+        size = max(1, len(misses) // ((os.cpu_count() or 1) * 4))
+        loop = asyncio.get_running_loop()
+        chunks = await asyncio.gather(*(
+            loop.run_in_executor(executor, _build_mock_expert_chunk, misses[i:i + size])
+            for i in range(0, len(misses), size)
+        ))
+        built = chain.from_iterable(chunks)
+    
+    return _merge_generated(talent_ids, cached, misses, built)
@@ -0,0 +1,79 @@
+"""
+真实专家数据 API 客户端
+
+配置 TALENT_API_URL 环境变量后启用（需安装 httpx）：
+1. 逐个请求 GET {TALENT_API_URL}/talents/{talent_id}，TALENT_API_KEY 作为 Bearer Token
+2. 所有 talent_id 并发请求，同时进行的请求数不超过 TALENT_API_CONCURRENCY
+3. 复用连接池，避免每个请求重新建立连接
+"""
+
+import asyncio
+import importlib.util
+import os
+from typing import List, Optional
+from urllib.parse import quote
+
+from app.models.schemas import Expert
+
+TALENT_API_URL = os.environ.get("TALENT_API_URL", "").rstrip("/")
+TALENT_API_KEY = os.environ.get("TALENT_API_KEY", "")
+
+# 同时进行的请求数上限
+TALENT_API_CONCURRENCY = int(os.environ.get("TALENT_API_CONCURRENCY", 64))
+
+# 单个请求超时（秒）
+TALENT_API_TIMEOUT = 10.0
+
+# 连接池大小
+MAX_CONNECTIONS = 100
+MAX_KEEPALIVE_CONNECTIONS = 20
+
+
+class TalentAPIClient:
+    """专家数据 API 客户端（异步，连接池在实例生命周期内复用）"""
+    
+    def __init__(
+        self,
+        base_url: str = TALENT_API_URL,
+        api_key: str = TALENT_API_KEY,
+        concurrency: int = TALENT_API_CONCURRENCY
+    ):
+        import httpx
+        
+        headers = {"Authorization": f"Bearer {api_key}"} if api_key else {}
+        self._client = httpx.AsyncClient(
+            base_url=base_url,
+            headers=headers,
+            timeout=TALENT_API_TIMEOUT,
+            limits=httpx.Limits(
+                max_connections=MAX_CONNECTIONS,
+                max_keepalive_connections=MAX_KEEPALIVE_CONNECTIONS
+            ),
+            # 安装了 h2 时启用 HTTP/2，多个请求复用同一连接
+            http2=importlib.util.find_spec("h2") is not None
+        )
+        self._semaphore = asyncio.Semaphore(concurrency)
+    
+    async def fetch_expert(self, talent_id: str) -> Optional[Expert]:
+        """获取单个专家，专家不存在（404）时返回 None"""
+        async with self._semaphore:
+            response = await self._client.get(f"/talents/{quote(talent_id, safe='')}")
+        
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
+        return Expert.model_validate_json(response.content)
+    
+    async def fetch_experts(self, talent_ids: List[str]) -> List[Expert]:
+        """
+        并发获取专家列表
+        
+        Returns:
+            按 talent_ids 顺序排列的专家列表（不存在的专家被跳过）
+        """
+        experts = await asyncio.gather(*(self.fetch_expert(tid) for tid in talent_ids))
+        return [e for e in experts if e is not None]
+    
+    async def aclose(self) -> None:
+        """关闭连接池"""
+        await self._client.aclose()
@@ -3,70 +3,230 @@
 
 负责：
 1. 解析上传的 talent_ids.txt
-2. 获取专家数据（当前使用 Mock，后续可对接真实 API）
+2. 获取专家数据（默认使用 Mock，配置 TALENT_API_URL 后对接真实 API）
 3. 计算统计指标
 """
 
-from typing import List, Dict, Tuple
+import codecs
+import hashlib
+import io
+import os
+from typing import List, Dict, Tuple, Optional
 from collections import Counter
+from itertools import chain
+from operator import attrgetter
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+import numpy as np
 from app.models.schemas import (
-    Expert, DashboardStats, TemplateRiskStats, QualityLabelStats
+    Expert, DashboardStats, TemplateRiskStats, QualityLabelStats,
+    DegreeLevel, SchoolTier, MASTERS_AND_ABOVE, ELITE_SCHOOL_TIERS
 )
-from app.services.mock_data import generate_mock_experts
+from app.services.mock_data import (
+    generate_mock_experts, generate_mock_experts_async, PARALLEL_THRESHOLD
+)
+from app.services.expert_cache import create_expert_cache
+from app.services.talent_api import TalentAPIClient, TALENT_API_URL
+
+# 探测上传文件编码时读取的字节数
+ENCODING_PROBE_SIZE = 4096
+
+# 统计用的枚举编码（列表下标即编码）
+DEGREE_LEVELS = list(DegreeLevel)
+SCHOOL_TIERS = list(SchoolTier)
+TEMPLATE_RISK_LEVELS = ["high", "medium", "low"]
+QUALITY_LABELS = ["high_quality", "normal", "risk"]
+
+DEGREE_CODES = {d: i for i, d in enumerate(DEGREE_LEVELS)}
+SCHOOL_TIER_CODES = {t: i for i, t in enumerate(SCHOOL_TIERS)}
+TEMPLATE_RISK_CODES = {r: i for i, r in enumerate(TEMPLATE_RISK_LEVELS)}
+QUALITY_LABEL_CODES = {q: i for i, q in enumerate(QUALITY_LABELS)}
+
+# 风险等级 / 质量标签为自由文本字段（可能来自外部 API），
+# 取值不在上述列表中时编码为列表长度，计数时丢弃该位（不计入任何一档）
+UNKNOWN_TEMPLATE_RISK_CODE = len(TEMPLATE_RISK_LEVELS)
+UNKNOWN_QUALITY_LABEL_CODE = len(QUALITY_LABELS)
+
+# 枚举值与 KPI 涉及的编码在导入时确定，统计时不再逐次访问枚举的 .value
+DEGREE_LABELS = [d.value for d in DEGREE_LEVELS]
+SCHOOL_TIER_LABELS = [t.value for t in SCHOOL_TIERS]
+
+# KPI 口径（schemas 中定义）对应的编码，按编码整列计数
+MASTERS_AND_ABOVE_CODES = [DEGREE_CODES[d] for d in DEGREE_LEVELS if d in MASTERS_AND_ABOVE]
+ELITE_SCHOOL_CODES = [SCHOOL_TIER_CODES[t] for t in SCHOOL_TIERS if t in ELITE_SCHOOL_TIERS]
+
+# 多样性评分分档：上界（含）与标签
+DIVERSITY_BUCKET_EDGES = np.array([30, 50, 70])
+DIVERSITY_BUCKET_LABELS = ["0-30", "31-50", "51-70", "71-100"]
+
+# 统计所需字段及其列类型（列式 SoA 布局，每列一个连续数组）
+EXPERT_COLUMNS = (
+    ('degree', np.int8),
+    ('school_tier', np.int8),
+    ('template_risk', np.int8),
+    ('quality_label', np.int8),
+    ('has_big_company', np.bool_),
+    ('task_count', np.int32),
+    ('unique_patterns', np.int32),
+    ('template_ratio', np.float64),
+    ('type_score', np.int16),
+    ('domain_score', np.int16),
+    ('structure_score', np.int16),
+    ('diversity_score', np.int16),
+)
+
+
+def _content_key(file_content: bytes) -> str:
+    """上传内容的哈希（相同文件得到相同的缓存键）"""
+    return hashlib.blake2b(file_content, digest_size=16).hexdigest()
+
+
+def _sniff_encoding(content: bytes) -> str:
+    """根据 BOM 或文件开头 ENCODING_PROBE_SIZE 字节判断编码（UTF-8 / GBK）"""
+    if content.startswith(codecs.BOM_UTF8):
+        return 'utf-8-sig'
+    try:
+        # 增量解码器允许探测区末尾截断的多字节字符
+        codecs.getincrementaldecoder('utf-8')().decode(content[:ENCODING_PROBE_SIZE])
+        return 'utf-8'
+    except UnicodeDecodeError:
+        return 'gbk'
+
+
+def _decode_line(line: bytes, encoding: str) -> str:
+    """按探测出的编码解码一行，失败时回退另一种编码"""
+    try:
+        return line.decode(encoding)
+    except UnicodeDecodeError:
+        return line.decode('utf-8' if encoding == 'gbk' else 'gbk')
+
+
+def _to_columnar(experts: List[Expert]) -> Tuple[Dict[str, np.ndarray], Counter, Counter]:
+    """
+    遍历专家列表，收集统计所需的全部数据
+    
+    Returns:
+        ({列名: 连续数组}（见 EXPERT_COLUMNS）, 技术栈计数, 任务类型计数)
+    """
+    rows = []
+    for e in experts:
+        rows.append((
+            DEGREE_CODES[e.degree],
+            SCHOOL_TIER_CODES[e.school_tier],
+            TEMPLATE_RISK_CODES.get(e.template_risk_level, UNKNOWN_TEMPLATE_RISK_CODE),
+            QUALITY_LABEL_CODES.get(e.quality_label, UNKNOWN_QUALITY_LABEL_CODE),
+            e.has_big_company_exp,
+            e.task_count,
+            e.unique_patterns,
+            e.template_ratio,
+            e.type_score,
+            e.domain_score,
+            e.structure_score,
+            e.diversity_score,
+        ))
+    
+    # 变长字段展平后一次性计数，整个计数循环在 C 层完成
+    tech_stack_counter = Counter(chain.from_iterable(map(attrgetter('tech_stacks'), experts)))
+    task_type_counter = Counter(chain.from_iterable(map(attrgetter('task_types'), experts)))
+    
+    # 行转列：每个字段一个连续数组，按列归约时顺序访问内存
+    values = zip(*rows) if rows else ((),) * len(EXPERT_COLUMNS)
+    columns = {
+        name: np.array(col, dtype=dtype)
+        for (name, dtype), col in zip(EXPERT_COLUMNS, values)
+    }
+    return columns, tech_stack_counter, task_type_counter
+
+
+def _count_distribution(counts: np.ndarray, labels: List[str]) -> Dict[str, int]:
+    """按编码计数结果生成 {枚举值: 数量}（省略数量为 0 的项）"""
+    return {label: int(c) for label, c in zip(labels, counts) if c}
 
 
 class TalentService:
     """专家数据服务类"""
     
     def __init__(self):
-        # 缓存专家数据（后续可改为 Redis 等）
-        self._experts_cache: Dict[str, List[Expert]] = {}
+        # 按上传内容缓存统计结果与专家明细（配置 REDIS_URL 时使用 Redis，否则为进程内 TTL + LRU 缓存）
+        self._expert_cache = create_expert_cache()
+        # Mock 数据生成进程池（按需创建并复用，避免每次请求 fork）
+        self._executor: Optional[ProcessPoolExecutor] = None
+        # 真实 API 客户端（首次使用时创建，复用连接池）
+        self._api_client: Optional[TalentAPIClient] = None
+    
+    def _get_executor(self) -> Optional[ProcessPoolExecutor]:
+        """获取进程池，单核环境下返回 None"""
+        if (os.cpu_count() or 1) < 2:
+            return None
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor()
+        return self._executor
+    
+    def _shutdown_executor(self, wait: bool = True) -> None:
+        """关闭进程池（下次需要时重新创建）"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
+    
+    def _get_api_client(self) -> TalentAPIClient:
+        """获取真实 API 客户端"""
+        if self._api_client is None:
+            self._api_client = TalentAPIClient()
+        return self._api_client
+    
+    async def aclose(self) -> None:
+        """释放 Mock 数据进程池、真实 API 客户端和会话缓存的连接"""
+        self._shutdown_executor()
+        await self._expert_cache.aclose()
+        if self._api_client is not None:
+            await self._api_client.aclose()
+            self._api_client = None
     
-    def parse_talent_ids(self, file_content: str) -> List[str]:
+    def parse_talent_ids(self, file_content: bytes) -> List[str]:
         """
         解析 talent_ids.txt 文件内容
         
+        先用文件开头判断编码，再逐行读取原始字节并解码，
+        避免整文件解码多持有一份完整副本，也避免 GBK 文件整体先按 UTF-8 试解码；
+        行按需读取（不生成全部行的列表），解析过程中只持有去重结果
+        
         Args:
-            file_content: 文件内容，每行一个 talent_id
+            file_content: 文件原始内容，每行一个 talent_id（UTF-8 或 GBK 编码）
             
         Returns:
             去重后的 talent_id 列表
+            
+        Raises:
+            UnicodeDecodeError: 文件内容既不是 UTF-8 也不是 GBK 编码
         """
-        lines = file_content.strip().split('\n')
-        talent_ids = []
-        
-        for line in lines:
-            tid = line.strip()
-            # 跳过空行和注释
-            if tid and not tid.startswith('#'):
-                talent_ids.append(tid)
-        
-        # 去重但保持顺序
-        seen = set()
-        unique_ids = []
-        for tid in talent_ids:
-            if tid not in seen:
-                seen.add(tid)
-                unique_ids.append(tid)
-        
-        return unique_ids
+        encoding = _sniff_encoding(file_content)
+        # 按 \n 切行，strip 同时去掉 \r\n 的 \r（GBK / UTF-8 多字节字符中不会出现换行字节）
+        tids = (_decode_line(line, encoding).strip() for line in io.BytesIO(file_content))
+        
+        # 跳过空行和注释；dict.fromkeys 单次遍历完成去重并保持顺序
+        return list(dict.fromkeys(tid for tid in tids if tid and not tid.startswith('#')))
     
-    def fetch_experts(self, talent_ids: List[str], use_mock: bool = True) -> List[Expert]:
+    async def fetch_experts(self, talent_ids: List[str], use_mock: bool = True) -> List[Expert]:
         """
         获取专家数据
         
         Args:
             talent_ids: 专家 ID 列表
-            use_mock: 是否使用 Mock 数据（后续可对接真实 API）
+            use_mock: 是否使用 Mock 数据，否则并发请求真实 API（见 talent_api）
             
         Returns:
-            专家列表
+            专家列表（真实 API 中不存在的专家被跳过）
         """
         if use_mock:
-            return generate_mock_experts(talent_ids)
+            executor = self._get_executor() if len(talent_ids) >= PARALLEL_THRESHOLD else None
+            try:
+                return await generate_mock_experts_async(talent_ids, executor)
+            except BrokenProcessPool:
+                # worker 进程异常退出后进程池不可再用：丢弃（下次请求重建），本次在当前进程生成
+                self._shutdown_executor(wait=False)
+                return generate_mock_experts(talent_ids)
         else:
-            # TODO: 对接真实 API
-            raise NotImplementedError("真实 API 暂未实现")
+            return await self._get_api_client().fetch_experts(talent_ids)
     
     def calculate_stats(self, experts: List[Expert]) -> DashboardStats:
         """
@@ -90,112 +250,113 @@ class TalentService:
             )
         
         total = len(experts)
+        # 前面已排除空列表，total > 0；各项占比统一乘以该系数
+        inv_total_pct = 100.0 / total
+        
+        # 数值/枚举字段转为列式数组（各项统计均为整列向量化运算），
+        # 并完成技术栈、任务类型这两个变长字段的计数。
+        # 超大列表也在当前进程完成：把 Expert 序列化传给子进程的开销
+        # （5 万位专家约 1.5s）远大于这一步本身（约 0.1s）
+        cols, tech_stack_counter, task_type_counter = _to_columnar(experts)
+        
+        # 学历、学校层级各计数一次，分布和 KPI 共用
+        degree_counts = np.bincount(cols['degree'], minlength=len(DEGREE_LABELS))
+        tier_counts = np.bincount(cols['school_tier'], minlength=len(SCHOOL_TIER_LABELS))
         
         # 学历分布
-        degree_dist = Counter(e.degree.value for e in experts)
+        degree_dist = _count_distribution(degree_counts, DEGREE_LABELS)
         
         # 学校层级分布
-        school_tier_dist = Counter(e.school_tier.value for e in experts)
+        school_tier_dist = _count_distribution(tier_counts, SCHOOL_TIER_LABELS)
         
         # 技术栈分布
-        tech_stack_counter = Counter()
-        for e in experts:
-            for tech in e.tech_stacks:
-                tech_stack_counter[tech] += 1
         tech_stack_dist = dict(tech_stack_counter.most_common(10))
         
         # 任务统计
-        task_counts = [e.task_count for e in experts]
-        total_tasks = sum(task_counts)
-        avg_tasks = total_tasks / total if total > 0 else 0
-        high_task_experts = sum(1 for tc in task_counts if tc >= 10)
+        total_tasks = int(cols['task_count'].sum())
+        avg_tasks = total_tasks / total
+        high_task_experts = int(np.count_nonzero(cols['task_count'] >= 10))
         
         task_stats = {
             "total_tasks": total_tasks,
             "avg_tasks_per_expert": round(avg_tasks, 2),
             "high_task_expert_count": high_task_experts,
-            "high_task_expert_pct": round(high_task_experts / total * 100, 1) if total > 0 else 0
+            "high_task_expert_pct": round(high_task_experts * inv_total_pct, 1)
         }
         
         # 任务类型分布
-        task_type_counter = Counter()
-        for e in experts:
-            for tt in e.task_types:
-                task_type_counter[tt] += 1
         task_type_dist = dict(task_type_counter)
         
         # KPI 指标
-        masters_and_above = sum(1 for e in experts if e.degree.value in ["硕士", "博士"])
-        elite_schools = sum(1 for e in experts if e.school_tier.value in ["985", "211", "海外名校"])
-        big_company_exp = sum(1 for e in experts if e.has_big_company_exp)
+        masters_and_above = int(degree_counts[MASTERS_AND_ABOVE_CODES].sum())
+        elite_schools = int(tier_counts[ELITE_SCHOOL_CODES].sum())
+        big_company_exp = int(np.count_nonzero(cols['has_big_company']))
         
         kpi = {
             "masters_and_above_count": masters_and_above,
-            "masters_and_above_pct": round(masters_and_above / total * 100, 1) if total > 0 else 0,
+            "masters_and_above_pct": round(masters_and_above * inv_total_pct, 1),
             "elite_school_count": elite_schools,
-            "elite_school_pct": round(elite_schools / total * 100, 1) if total > 0 else 0,
+            "elite_school_pct": round(elite_schools * inv_total_pct, 1),
             "big_company_count": big_company_exp,
-            "big_company_pct": round(big_company_exp / total * 100, 1) if total > 0 else 0,
+            "big_company_pct": round(big_company_exp * inv_total_pct, 1),
         }
         
         # ===== 模板化风险统计 =====
-        high_risk = sum(1 for e in experts if e.template_risk_level == "high")
-        medium_risk = sum(1 for e in experts if e.template_risk_level == "medium")
-        low_risk = sum(1 for e in experts if e.template_risk_level == "low")
+        risk_counts = np.bincount(cols['template_risk'], minlength=UNKNOWN_TEMPLATE_RISK_CODE + 1)
+        high_risk, medium_risk, low_risk = (int(c) for c in risk_counts[:UNKNOWN_TEMPLATE_RISK_CODE])
         
-        avg_template_ratio = sum(e.template_ratio for e in experts) / total if total > 0 else 0
-        avg_unique_patterns = sum(e.unique_patterns for e in experts) / total if total > 0 else 0
+        avg_template_ratio = float(cols['template_ratio'].mean())
+        avg_unique_patterns = float(cols['unique_patterns'].mean())
         
         template_risk_stats = TemplateRiskStats(
             high_risk_count=high_risk,
-            high_risk_pct=round(high_risk / total * 100, 1) if total > 0 else 0,
+            high_risk_pct=round(high_risk * inv_total_pct, 1),
             medium_risk_count=medium_risk,
-            medium_risk_pct=round(medium_risk / total * 100, 1) if total > 0 else 0,
+            medium_risk_pct=round(medium_risk * inv_total_pct, 1),
             low_risk_count=low_risk,
-            low_risk_pct=round(low_risk / total * 100, 1) if total > 0 else 0,
+            low_risk_pct=round(low_risk * inv_total_pct, 1),
             avg_template_ratio=round(avg_template_ratio, 3),
             avg_unique_patterns=round(avg_unique_patterns, 1)
         )
         
         # ===== 质量标签统计 =====
-        high_quality = sum(1 for e in experts if e.quality_label == "high_quality")
-        normal_quality = sum(1 for e in experts if e.quality_label == "normal")
-        risk_quality = sum(1 for e in experts if e.quality_label == "risk")
+        label_counts = np.bincount(cols['quality_label'], minlength=UNKNOWN_QUALITY_LABEL_CODE + 1)
+        high_quality, normal_quality, risk_quality = (
+            int(c) for c in label_counts[:UNKNOWN_QUALITY_LABEL_CODE]
+        )
         
         quality_label_stats = QualityLabelStats(
             high_quality_count=high_quality,
-            high_quality_pct=round(high_quality / total * 100, 1) if total > 0 else 0,
+            high_quality_pct=round(high_quality * inv_total_pct, 1),
             normal_count=normal_quality,
-            normal_pct=round(normal_quality / total * 100, 1) if total > 0 else 0,
+            normal_pct=round(normal_quality * inv_total_pct, 1),
             risk_count=risk_quality,
-            risk_pct=round(risk_quality / total * 100, 1) if total > 0 else 0
+            risk_pct=round(risk_quality * inv_total_pct, 1)
         )
         
         # ===== 多样性评分分布 =====
-        diversity_buckets = {"0-30": 0, "31-50": 0, "51-70": 0, "71-100": 0}
-        for e in experts:
-            score = e.diversity_score
-            if score <= 30:
-                diversity_buckets["0-30"] += 1
-            elif score <= 50:
-                diversity_buckets["31-50"] += 1
-            elif score <= 70:
-                diversity_buckets["51-70"] += 1
-            else:
-                diversity_buckets["71-100"] += 1
+        # side='left'：等于上界的分数落在该档内（30 分属于 "0-30"）
+        scores = cols['diversity_score']
+        bucket_counts = np.bincount(
+            np.searchsorted(DIVERSITY_BUCKET_EDGES, scores, side='left'),
+            minlength=len(DIVERSITY_BUCKET_LABELS)
+        )
+        diversity_buckets = {
+            label: int(c) for label, c in zip(DIVERSITY_BUCKET_LABELS, bucket_counts)
+        }
         
         # ===== 平均分数 =====
         avg_scores = {
-            "type_score": round(sum(e.type_score for e in experts) / total, 1) if total > 0 else 0,
-            "domain_score": round(sum(e.domain_score for e in experts) / total, 1) if total > 0 else 0,
-            "structure_score": round(sum(e.structure_score for e in experts) / total, 1) if total > 0 else 0,
-            "diversity_score": round(sum(e.diversity_score for e in experts) / total, 1) if total > 0 else 0,
+            "type_score": round(float(cols['type_score'].mean()), 1),
+            "domain_score": round(float(cols['domain_score'].mean()), 1),
+            "structure_score": round(float(cols['structure_score'].mean()), 1),
+            "diversity_score": round(float(scores.mean()), 1),
         }
         
         return DashboardStats(
             total_experts=total,
-            degree_distribution=dict(degree_dist),
-            school_tier_distribution=dict(school_tier_dist),
+            degree_distribution=degree_dist,
+            school_tier_distribution=school_tier_dist,
             tech_stack_distribution=tech_stack_dist,
             task_stats=task_stats,
             task_type_distribution=task_type_dist,
@@ -206,29 +367,49 @@ class TalentService:
             avg_scores=avg_scores
         )
     
-    def process_upload(self, file_content: str, session_id: str) -> Tuple[List[Expert], DashboardStats]:
+    async def process_upload(self, file_content: bytes, session_id: str) -> int:
         """
         处理上传文件的完整流程
         
+        结果按文件内容哈希缓存，同一文件再次上传时直接绑定已有结果，
+        跳过解析、获取专家数据和统计计算
+        
         Args:
-            file_content: 文件内容
+            file_content: 文件原始内容
             session_id: 会话 ID（用于缓存）
             
         Returns:
-            (专家列表, 统计数据)
+            专家数量
         """
+        content_key = _content_key(file_content)
+        if await self._expert_cache.bind(session_id, content_key):
+            total, _ = await self._expert_cache.get_page(session_id, limit=0)
+            return total
+        
         talent_ids = self.parse_talent_ids(file_content)
-        experts = self.fetch_experts(talent_ids)
+        experts = await self.fetch_experts(talent_ids, use_mock=not TALENT_API_URL)
         stats = self.calculate_stats(experts)
         
-        # 缓存结果
-        self._experts_cache[session_id] = experts
+        # 缓存结果（统计数据此后不再重复计算）
+        await self._expert_cache.set(content_key, experts, stats)
+        await self._expert_cache.bind(session_id, content_key)
         
-        return experts, stats
+        return len(experts)
     
-    def get_cached_experts(self, session_id: str) -> List[Expert]:
-        """获取缓存的专家数据"""
-        return self._experts_cache.get(session_id, [])
+    async def get_cached_stats_json(self, session_id: str) -> Optional[bytes]:
+        """获取缓存的统计数据（已序列化的 JSON），会话不存在或无专家时返回 None"""
+        return await self._expert_cache.get_stats_json(session_id)
+    
+    async def get_cached_expert_page(
+        self, session_id: str, offset: int = 0, limit: int = 50
+    ) -> Tuple[int, List[Dict]]:
+        """
+        分页获取缓存的专家序列化数据
+        
+        Returns:
+            (专家总数, 当前页专家数据)，会话不存在时为 (0, [])
+        """
+        return await self._expert_cache.get_page(session_id, offset, limit)
 
 
 # 单例服务
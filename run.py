@@ -6,12 +6,29 @@
     python run.py              # 默认 8080 端口
     python run.py --port 3000  # 指定端口
     python run.py --reload     # 开发模式（热重载）
+    python run.py --workers 4  # 多进程（需配置 REDIS_URL 共享会话数据）
 """
 
 import argparse
 import os
 import uvicorn
 
+# 多 worker 部署时的默认进程数上限
+MAX_DEFAULT_WORKERS = 4
+
+
+def default_workers() -> int:
+    """
+    默认 worker 数
+    
+    会话数据默认缓存在进程内，多个 worker 之间不共享，
+    因此仅在配置了 REDIS_URL 时才默认启用多进程
+    （此时 Redis 不可用会直接启动失败，不会回退到进程内缓存）
+    """
+    if not os.environ.get("REDIS_URL"):
+        return 1
+    return min(os.cpu_count() or 1, MAX_DEFAULT_WORKERS)
+
 
 def main():
     parser = argparse.ArgumentParser(description="启动专家画像 Dashboard")
@@ -31,8 +48,22 @@ def main():
         action="store_true",
         help="开发模式，启用热重载"
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=default_workers(),
+        help=f"worker 进程数 (默认: 配置 REDIS_URL 时为 min(CPU 核数, {MAX_DEFAULT_WORKERS})，否则为 1；--reload 时固定为 1)"
+    )
+    parser.add_argument(
+        "--log-level",
+        default=os.environ.get("LOG_LEVEL", "warning"),
+        choices=["critical", "error", "warning", "info", "debug", "trace"],
+        help="日志级别 (默认: warning，不输出逐请求访问日志；支持 LOG_LEVEL 环境变量)"
+    )
     
     args = parser.parse_args()
+    # 热重载只支持单进程
+    workers = 1 if args.reload else max(1, args.workers)
     
     print(f"""
 ╔════════════════════════════════════════════════════════╗
@@ -46,11 +77,18 @@ def main():
 ╚════════════════════════════════════════════════════════╝
     """)
     
+    # auto：安装了 uvicorn[standard] 时使用 uvloop 事件循环和 httptools 解析器，
+    # 否则（如 Windows 上没有 uvloop）回退到 asyncio / h11
     uvicorn.run(
         "app.main:app",
         host=args.host,
         port=args.port,
-        reload=args.reload
+        reload=args.reload,
+        workers=workers,
+        loop="auto",
+        http="auto",
+        log_level=args.log_level,
+        access_log=args.log_level in ("info", "debug", "trace")
     )
 
 
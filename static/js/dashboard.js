@@ -107,7 +107,7 @@ function handleFileSelect(e) {
 
 async function handleFile(file) {
     // 验证文件
-    if (!file.name.endsWith('.txt')) {
+    if (!/\.(txt|text)$/i.test(file.name)) {
         showStatus('请上传 .txt 文件', 'error');
         return;
     }